@@ -17,9 +17,10 @@ import re
 import sys
 import subprocess
 import webbrowser
+import weakref
 import tempfile
 from collections import defaultdict
-from functools import partial
+from pathlib import Path
 
 from pymol import cmd, CmdException
 from pymol.plugins import addmenuitemqt
@@ -34,6 +35,12 @@ def _safe_print(msg):
     except Exception:
         pass
 
+def _safe(fn, *args, **kwargs):
+    try:
+        return fn(*args, **kwargs)
+    except Exception:
+        return None
+
 def _ensure_module(mod, pip_name=None):
     pip_name = pip_name or mod
     try:
@@ -51,11 +58,14 @@ def _ensure_module(mod, pip_name=None):
 try:
     from PyQt5.QtWidgets import (
         QDialog, QVBoxLayout, QLabel, QComboBox, QPushButton, QDialogButtonBox,
-        QApplication, QGroupBox, QRadioButton, QHBoxLayout, QTableWidget,
-        QTableWidgetItem, QHeaderView, QMessageBox, QFileDialog,
+        QApplication, QGroupBox, QRadioButton, QHBoxLayout, QTableView,
+        QStyledItemDelegate, QHeaderView, QMessageBox, QFileDialog,
         QAbstractItemView, QSpinBox, QInputDialog, QLineEdit, QTabWidget, QWidget
     )
-    from PyQt5.QtCore import Qt
+    from PyQt5.QtCore import (
+        Qt, QAbstractTableModel, QModelIndex, QObject, QRunnable, QThreadPool,
+        pyqtSignal
+    )
 except Exception:
     PYQT_AVAILABLE = False
     _safe_print("PyBmw Error: PyQt5 not found. This plugin needs a PyMOL build with Qt.")
@@ -67,45 +77,80 @@ if _ensure_module("bs4", "beautifulsoup4"):
     BS4_AVAILABLE = True
     from bs4 import BeautifulSoup
 
+# numpy/scipy usually ship with PyMOL builds; the clash scan falls back to
+# cmd.find_pairs when they are missing, so no auto-install attempt here.
+NUMPY_AVAILABLE = False
+SCIPY_AVAILABLE = False
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except Exception:
+    np = None
+try:
+    from scipy.spatial import cKDTree
+    SCIPY_AVAILABLE = True
+except Exception:
+    cKDTree = None
+
 SAVES_UPLOAD_ENDPOINT = "https://saves.mbi.ucla.edu/"
 SAVES_BASE_URL = "https://saves.mbi.ucla.edu"
 
+_DIGITS_TO_NONE = str.maketrans('', '', '0123456789')
+_LOCATION_SPLIT = re.compile(r'[\s/]+')
+# Numeric part of a resi like "52", "-3" or "52A" (insertion code).
+_RESI_NUMBER = re.compile(r'-?\d+')
+
+_AMINO_ACIDS = ("ALA","ARG","ASN","ASP","CYS","GLN","GLU","GLY","HIS","ILE","LEU","LYS","MET","PHE","PRO","SER","THR","TRP","TYR","VAL")
+_AMINO_ACID_SET = frozenset(_AMINO_ACIDS)
+
+_VDW_RADII = {'H': 1.2, 'C': 1.7, 'N': 1.55, 'O': 1.52, 'S': 1.8, 'P': 1.8}
+_DEFAULT_VDW = 1.7
+
 DEBUG_PYBMW = False
 def debug_log(msg):
     if DEBUG_PYBMW:
         _safe_print(f"[PyBmw Debug] {msg}")
 
-PYMOL_CAPS = {
-    "supports_sculpting": False,
-    "sculpt_setting_name": None,
-}
+_caps = None
 
-def detect_pymol_capabilities():
+def _detect_pymol_capabilities():
+    caps = {
+        "supports_sculpting": False,
+        "sculpt_setting_name": None,
+    }
     candidates = ["sculpt_iterations", "wizard_sculpt_cycles"]
     try:
         try:
             cmd.get("sculpting")
-            PYMOL_CAPS["supports_sculpting"] = True
+            caps["supports_sculpting"] = True
         except CmdException:
-            PYMOL_CAPS["supports_sculpting"] = False
+            caps["supports_sculpting"] = False
         for name in candidates:
             try:
                 cmd.get(name)
-                PYMOL_CAPS["sculpt_setting_name"] = name
+                caps["sculpt_setting_name"] = name
                 break
             except CmdException:
                 continue
     except Exception as e:
-        PYMOL_CAPS["supports_sculpting"] = False
-        PYMOL_CAPS["sculpt_setting_name"] = None
+        caps["supports_sculpting"] = False
+        caps["sculpt_setting_name"] = None
         debug_log(f"Capability detection error: {e}")
+    return caps
 
-try:
-    detect_pymol_capabilities()
-except Exception as e:
-    debug_log(f"Initial capability detection failed: {e}")
+def get_pymol_caps():
+    global _caps
+    if _caps is None:
+        _caps = _detect_pymol_capabilities()
+    return _caps
+
+def detect_pymol_capabilities():
+    global _caps
+    _caps = _detect_pymol_capabilities()
+    return _caps
 
 dialog = None
+_cached_parent = None
 
 class ExportDialog(QDialog):
     def __init__(self, parent=None):
@@ -128,16 +173,140 @@ class ExportDialog(QDialog):
         layout.addWidget(group_box)
         layout.addWidget(self.button_box)
 
-    @staticmethod
-    def get_export_options(parent=None):
-        dialog = ExportDialog(parent)
-        result = dialog.exec_()
-        if result == QDialog.Accepted:
-            if dialog.pdb_only_radio.isChecked(): return "pdb"
-            if dialog.session_only_radio.isChecked(): return "session"
-            if dialog.both_radio.isChecked(): return "both"
+    def get_choice(self):
+        if self.exec_() == QDialog.Accepted:
+            if self.pdb_only_radio.isChecked(): return "pdb"
+            if self.session_only_radio.isChecked(): return "session"
+            if self.both_radio.isChecked(): return "both"
         return None
 
+class _WorkerSignals(QObject):
+    finished = pyqtSignal(int)
+
+class _WriteSignals(QObject):
+    finished = pyqtSignal(bool, str)
+
+class _FileWriteWorker(QRunnable):
+    """Writes pre-serialized bytes to disk off the GUI thread."""
+
+    def __init__(self, path, data):
+        super(_FileWriteWorker, self).__init__()
+        self.signals = _WriteSignals()
+        self._path = path
+        self._data = data
+
+    def run(self):
+        try:
+            Path(self._path).write_bytes(self._data)
+            ok = True
+        except Exception as e:
+            debug_log(f"Background file write failed: {e}")
+            ok = False
+        self.signals.finished.emit(ok, self._path)
+
+class _ClashWorker(QRunnable):
+    """Counts clashes off the GUI thread. The callable must be pure
+    Python/NumPy -- PyMOL's C API is not thread-safe, so any atom data is
+    collected on the main thread before dispatch."""
+
+    def __init__(self, count_fn):
+        super(_ClashWorker, self).__init__()
+        self.signals = _WorkerSignals()
+        self._count_fn = count_fn
+
+    def run(self):
+        try:
+            count = self._count_fn()
+        except Exception as e:
+            debug_log(f"Background clash scan failed: {e}")
+            count = 0
+        self.signals.finished.emit(count)
+
+class ResidueTableModel(QAbstractTableModel):
+    HEADERS = ["Residue", "Mutate To"]
+
+    def __init__(self, panel, parent=None):
+        super(ResidueTableModel, self).__init__(parent)
+        self._panel = panel
+        self._rows = []
+        self._targets = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else 2
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole and 0 <= section < len(self.HEADERS):
+            return self.HEADERS[section]
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        if index.column() == 1:
+            flags |= Qt.ItemIsEditable
+        return flags
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or not (0 <= index.row() < len(self._rows)):
+            return None
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            res_tuple = self._rows[index.row()]
+            if index.column() == 0:
+                resn = self._panel.original_residues.get(res_tuple, "UNK")
+                return f"{res_tuple[0]}/{res_tuple[1]}/{resn}{res_tuple[2]}"
+            return self._targets[index.row()]
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if role != Qt.EditRole or not index.isValid() or index.column() != 1:
+            return False
+        row = index.row()
+        if not (0 <= row < len(self._targets)):
+            return False
+        self._targets[row] = str(value)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.EditRole])
+        return True
+
+    def set_residues(self, residues, targets):
+        self.beginResetModel()
+        self._rows = list(residues)
+        self._targets = list(targets)
+        self.endResetModel()
+
+    def remove_row(self, row):
+        if not (0 <= row < len(self._rows)):
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self._rows.pop(row)
+        self._targets.pop(row)
+        self.endRemoveRows()
+
+    def clear(self):
+        self.set_residues([], [])
+
+    def target_for_row(self, row):
+        return self._targets[row]
+
+class AAComboDelegate(QStyledItemDelegate):
+    def __init__(self, amino_acids, parent=None):
+        super(AAComboDelegate, self).__init__(parent)
+        self.amino_acids = amino_acids
+
+    def createEditor(self, parent, option, index):
+        combo = QComboBox(parent)
+        combo.addItems(self.amino_acids)
+        return combo
+
+    def setEditorData(self, editor, index):
+        editor.setCurrentText(index.data(Qt.EditRole) or self.amino_acids[0])
+
+    def setModelData(self, editor, model, index):
+        model.setData(index, editor.currentText(), Qt.EditRole)
+
 class PyBmwPanel(QDialog):
     def __init__(self, parent=None):
         super(PyBmwPanel, self).__init__(parent)
@@ -149,10 +318,34 @@ class PyBmwPanel(QDialog):
         self.original_residues = {}
         self.mutated_residue_info = {}
         self.csv_targets = {}
-        self.amino_acids = ["ALA","ARG","ASN","ASP","CYS","GLN","GLU","GLY","HIS","ILE","LEU","LYS","MET","PHE","PRO","SER","THR","TRP","TYR","VAL"]
+        self.amino_acids = list(_AMINO_ACIDS)
         self.sorted_residue_list = []
         self.step_index = 0
         self.last_saves_email = "example@email.com"
+        self._dirty_table = False
+        self._dirty_view = False
+        self._resn_cache = {}
+        self._last_sculpt_state = (None, None)
+        self._sort_key_cache = {}
+        self._sele_cache = {}
+        self._has_objects = False
+        self._visuals_applied = False
+        self._mut_version = 0
+        self._clash_arrays = None
+        self._clash_arrays_version = None
+        self._mut_sele_cache = None
+        self._mut_sele_version = None
+        self._mut_groups = defaultdict(list)
+        self._rotamer_total = None
+        self._wizard_installed = False
+        self._export_scan_pending = False
+        self._target_object = None
+        self._primed_wizard = None
+        self._export_dialog = None
+        self._last_scan_version = None
+        self._last_scan_count = 0
+        self._pending_scan_version = None
+        self._highlight_names = set()
 
         self.main_layout = QVBoxLayout(self)
         self.tab_widget = QTabWidget()
@@ -194,7 +387,8 @@ class PyBmwPanel(QDialog):
         refinement_layout = QHBoxLayout()
         self.refinement_combo = QComboBox()
         opts = ["Wizard Default Rotamer"]
-        if PYMOL_CAPS["supports_sculpting"] and PYMOL_CAPS["sculpt_setting_name"]:
+        caps = get_pymol_caps()
+        if caps["supports_sculpting"] and caps["sculpt_setting_name"]:
             opts.append("Sculpt Rotamer")
         self.refinement_combo.addItems(opts)
         self.sculpt_cycles_spinbox = QSpinBox()
@@ -228,9 +422,11 @@ class PyBmwPanel(QDialog):
             rotamer_layout.addWidget(w)
         self.rotamer_control_group.setLayout(rotamer_layout)
 
-        self.individual_table = QTableWidget()
-        self.individual_table.setColumnCount(2)
-        self.individual_table.setHorizontalHeaderLabels(["Residue", "Mutate To"])
+        self.individual_table = QTableView()
+        self.residue_model = ResidueTableModel(self)
+        self.individual_table.setModel(self.residue_model)
+        self.aa_delegate = AAComboDelegate(self.amino_acids, self.individual_table)
+        self.individual_table.setItemDelegateForColumn(1, self.aa_delegate)
         self.individual_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
         self.individual_table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.individual_table.setSelectionMode(QAbstractItemView.SingleSelection)
@@ -275,7 +471,8 @@ class PyBmwPanel(QDialog):
         self.prev_step_button.clicked.connect(self.show_previous_residue)
         self.apply_step_button.clicked.connect(self.apply_single_mutation_step)
         self.next_step_button.clicked.connect(self.show_next_residue)
-        self.individual_table.itemSelectionChanged.connect(self.prime_wizard_from_table_selection)
+        self.individual_table.selectionModel().selectionChanged.connect(self.prime_wizard_from_table_selection)
+        self.residue_model.dataChanged.connect(self._on_model_data_changed)
         self.prev_rotamer_button.clicked.connect(self._previous_rotamer)
         self.next_rotamer_button.clicked.connect(self._next_rotamer)
 
@@ -327,29 +524,83 @@ class PyBmwPanel(QDialog):
         about_layout.addWidget(label)
         about_layout.addStretch()
 
+    def _join_groups(self, groups):
+        parts = []
+        for (model, chain), resis in groups.items():
+            if chain:
+                parts.append(f"({model} and chain {chain} and resi {'+'.join(resis)})")
+            else:
+                # chain "" restricts to the blank chain like /model///resi
+                # did; dropping the clause would match every chain.
+                parts.append(f'({model} and chain "" and resi {"+".join(resis)})')
+        return " or ".join(parts)
+
+    def _grouped_selection(self, residues):
+        """Build one compact '(model and chain X and resi a+b+c)' clause per
+        (model, chain) group; long '/m//c/r or ...' chains make PyMOL's
+        selection parser crawl on big batches."""
+        groups = defaultdict(list)
+        for res_tuple in residues:
+            groups[(res_tuple[0], res_tuple[1])].append(res_tuple[2])
+        return self._join_groups(groups)
+
+    def _residue_sele(self, res_tuple):
+        sele = self._sele_cache.get(res_tuple)
+        if sele is None:
+            sele = f"/{res_tuple[0]}//{res_tuple[1]}/{res_tuple[2]}"
+            self._sele_cache[res_tuple] = sele
+        return sele
+
+    def _mutated_selection(self):
+        if self._mut_sele_version != self._mut_version:
+            self._mut_sele_cache = self._join_groups(self._mut_groups)
+            self._mut_sele_version = self._mut_version
+        return self._mut_sele_cache
+
+    def _refresh_has_objects(self):
+        try:
+            self._has_objects = bool(cmd.get_object_list('(all)'))
+        except Exception:
+            self._has_objects = False
+
+    def _ensure_resn_cache(self):
+        if self._resn_cache:
+            return
+        try:
+            cmd.iterate('name CA and polymer', 'c[(model, chain, resi)] = resn', space={'c': self._resn_cache})
+        except Exception as e:
+            debug_log(f"resn cache scan failed: {e}")
+
     def _residue_sort_key(self, res_tuple):
-        model, chain, resi_str = res_tuple
-        num_part = ''.join(filter(str.isdigit, resi_str))
-        char_part = ''.join(filter(str.isalpha, resi_str))
-        return (model, chain, int(num_part) if num_part else 0, char_part)
+        key = self._sort_key_cache.get(res_tuple)
+        if key is None:
+            model, chain, resi_str = res_tuple
+            char_part = resi_str.translate(_DIGITS_TO_NONE)
+            num_part = ''.join(c for c in resi_str if c.isdigit())
+            key = (model, chain, int(num_part) if num_part else 0, char_part)
+            self._sort_key_cache[res_tuple] = key
+        return key
+
+    def _delete_highlights(self):
+        # Only the names this panel created; a wildcard delete would make
+        # PyMOL scan its whole object list.
+        if self._highlight_names:
+            _safe(cmd.delete, " ".join(self._highlight_names))
+            self._highlight_names.clear()
 
     def _reset_staged_list(self):
-        try:
-            cmd.delete("highlight_sele")
-            cmd.delete("chain_highlight_*")
-        except Exception:
-            pass
+        self._delete_highlights()
         if self.mutated_residue_info:
-            mutated_sele = " or ".join([f"/{r[0]}//{r[1]}/{r[2]}" for r in self.mutated_residue_info.keys()])
             try:
-                cmd.color("cyan", mutated_sele)
+                cmd.color("cyan", self._mutated_selection())
             except Exception:
                 pass
         self.residues_to_mutate = set()
         self.sorted_residue_list = []
-        self.original_residues = {k: v for k, v in self.original_residues.items() if k in self.mutated_residue_info}
+        for k in self.original_residues.keys() - self.mutated_residue_info.keys():
+            del self.original_residues[k]
         try:
-            self.individual_table.setRowCount(0)
+            self.residue_model.clear()
         except Exception:
             pass
         total_mutated = len(self.mutated_residue_info)
@@ -357,40 +608,49 @@ class PyBmwPanel(QDialog):
         self.refresh_panel_view()
 
     def full_reset(self, preserve_selection=False):
-        try:
-            cmd.delete("highlight_sele")
-            cmd.delete("mutated_residues")
-            cmd.delete("chain_highlight_*")
-        except Exception:
-            pass
+        self._delete_highlights()
+        _safe(cmd.delete, "mutated_residues")
         if not preserve_selection:
             try:
                 cmd.select("none")
             except Exception:
                 pass
-        try:
-            for obj in cmd.get_object_list('(all)'):
-                try:
-                    cmd.util.cbag(obj)
-                except Exception:
-                    pass
-            cmd.label(selection="all", expression='""')
-        except Exception:
-            pass
+        if self._visuals_applied:
+            try:
+                for obj in cmd.get_object_list('(all)'):
+                    try:
+                        cmd.util.cbag(obj)
+                    except Exception:
+                        pass
+                cmd.label(selection="all", expression='""')
+            except Exception:
+                pass
+            self._visuals_applied = False
         self.residues_to_mutate = set()
         self.sorted_residue_list = []
         self.original_residues = {}
         self.mutated_residue_info = {}
         self.csv_targets = {}
         self.step_index = 0
+        self._resn_cache = {}
+        self._sort_key_cache = {}
+        self._sele_cache = {}
+        self._mut_version += 1
+        self._clash_arrays = None
+        self._clash_arrays_version = None
+        self._mut_groups = defaultdict(list)
+        self._refresh_has_objects()
         self.info_label.setText("Ready. Select residues and click 'Add to Selection'.")
         try:
-            self.individual_table.setRowCount(0)
+            self.residue_model.clear()
         except Exception:
             pass
         self.refresh_panel_view()
 
     def refresh_panel_view(self):
+        if not self.isVisible():
+            self._dirty_view = True
+            return
         is_batch = self.batch_mode_radio.isChecked()
         is_individual = self.individual_mode_radio.isChecked()
         is_step = self.step_mode_radio.isChecked()
@@ -399,8 +659,9 @@ class PyBmwPanel(QDialog):
         self.batch_group.setVisible(is_batch)
         self.individual_group.setVisible(is_individual or is_step)
         self.mutate_all_button.setVisible(is_batch or is_individual)
-        self.sculpt_cycles_label.setVisible(is_sculpt and PYMOL_CAPS["supports_sculpting"])
-        self.sculpt_cycles_spinbox.setVisible(is_sculpt and PYMOL_CAPS["supports_sculpting"])
+        supports_sculpting = get_pymol_caps()["supports_sculpting"]
+        self.sculpt_cycles_label.setVisible(is_sculpt and supports_sculpting)
+        self.sculpt_cycles_spinbox.setVisible(is_sculpt and supports_sculpting)
         self.rotamer_control_group.setVisible(is_step)
 
         for i in range(self.step_control_box.count()):
@@ -415,7 +676,7 @@ class PyBmwPanel(QDialog):
         has_completed_mutations = bool(self.mutated_residue_info)
         self.mutate_all_button.setEnabled(has_mutations_to_stage)
         self.clear_all_button.setEnabled(has_mutations_to_stage or has_completed_mutations)
-        self.export_button.setEnabled(has_completed_mutations or bool(cmd.get_object_list('(all)')))
+        self.export_button.setEnabled(has_completed_mutations or self._has_objects)
 
         if is_step:
             has_residues = bool(self.sorted_residue_list)
@@ -432,7 +693,11 @@ class PyBmwPanel(QDialog):
         try:
             if cmd.get_wizard():
                 current_state = cmd.get_state()
-                total_states = cmd.count_frames()
+                # count_frames only changes when the wizard is re-primed, so
+                # reuse the cached total while stepping through rotamers.
+                if self._rotamer_total is None:
+                    self._rotamer_total = cmd.count_frames()
+                total_states = self._rotamer_total
                 if total_states > 0:
                     self.rotamer_info_label.setText(f"Rotamer: {current_state} / {total_states}")
                 else:
@@ -463,38 +728,47 @@ class PyBmwPanel(QDialog):
         if not fileName:
             return
         all_objects = cmd.get_object_list('(all)')
+        self._has_objects = bool(all_objects)
         if not all_objects:
             QMessageBox.critical(self, "Error", "No molecular objects are loaded in PyMOL.")
             return
         self.csv_targets = {}
         found_residues = set()
         not_found = []
+        # iterate visits objects in registration order, so setdefault keeps
+        # the first object holding each chain/resi — the same deterministic
+        # pick the per-row get_object_list loop used to make.
+        present = {}
+        try:
+            cmd.iterate('polymer and name CA', 'present.setdefault((chain, resi), model)', space={'present': present})
+        except Exception as e:
+            debug_log(f"CSV residue pre-scan failed: {e}")
         try:
+            # Hot loop for big deep-mutational-scan CSVs: hoist lookups and
+            # only pay for string formatting on the error paths.
+            present_get = present.get
+            add_found = found_residues.add
+            split_location = _LOCATION_SPLIT.split
             with open(fileName, 'r', encoding='utf-8-sig') as csvfile:
                 reader = csv.reader(csvfile)
                 for row in reader:
                     if len(row) < 2:
                         continue
                     location, new_aa = row[0].strip(), row[1].strip().upper()
-                    if new_aa not in self.amino_acids:
+                    if new_aa not in _AMINO_ACID_SET:
                         not_found.append(f"Row '{','.join(row)}': '{new_aa}' is not a valid amino acid code.")
                         continue
-                    parts = location.replace('/', ' ').split()
+                    # Drop empty tokens so leading separators ('/A/123') parse
+                    # the same as the old replace('/', ' ').split() did.
+                    parts = [p for p in split_location(location.strip()) if p]
                     if len(parts) < 2:
                         not_found.append(f"Row '{','.join(row)}': Location format '{location}' is invalid. Use Chain ResID (e.g., A 123).")
                         continue
                     chain, resi = parts[0], parts[1]
-                    found_model = None
-                    for obj in all_objects:
-                        try:
-                            if cmd.count_atoms(f"/{obj}//{chain}/{resi} and polymer") > 0:
-                                found_model = obj
-                                break
-                        except Exception:
-                            continue
-                    if found_model:
-                        res_tuple = (found_model, chain, resi)
-                        found_residues.add(res_tuple)
+                    model = present_get((chain, resi))
+                    if model:
+                        res_tuple = (model, chain, resi)
+                        add_found(res_tuple)
                         self.csv_targets[res_tuple] = new_aa
                     else:
                         not_found.append(f"Row '{','.join(row)}': Residue {chain}/{resi} not found in any loaded object.")
@@ -514,7 +788,9 @@ class PyBmwPanel(QDialog):
             if cmd.count_atoms('(sele)') == 0:
                 return set()
             selected_set = set()
-            cmd.iterate('(sele) and polymer', 'selected_set.add((model, chain, resi))', space={'selected_set': selected_set})
+            # One callback per residue (CA) instead of one per atom; the
+            # object name is only available through iterate's 'model'.
+            cmd.iterate('byres ((sele) and polymer) and name CA', 'selected_set.add((model, chain, resi))', space={'selected_set': selected_set})
             return set((str(m), str(c), str(r)) for (m, c, r) in selected_set)
         except Exception:
             return set()
@@ -534,14 +810,23 @@ class PyBmwPanel(QDialog):
         except Exception:
             pass
 
+    def showEvent(self, event):
+        super(PyBmwPanel, self).showEvent(event)
+        if self._dirty_table:
+            self._dirty_table = False
+            self._populate_table()
+        if self._dirty_view:
+            self._dirty_view = False
+            self.refresh_panel_view()
+
     def _populate_table(self):
+        if not self.isVisible():
+            self._dirty_table = True
+            return
         if self.residues_to_mutate:
+            self._visuals_applied = True
             self.info_label.setText(f"{len(self.residues_to_mutate)} residues staged for mutation.")
-            try:
-                cmd.delete("highlight_sele")
-                cmd.delete("chain_highlight_*")
-            except CmdException:
-                pass
+            self._delete_highlights()
             residues_by_chain = defaultdict(list)
             for res_tuple in self.residues_to_mutate:
                 residues_by_chain[(res_tuple[0], res_tuple[1])].append(res_tuple)
@@ -552,120 +837,154 @@ class PyBmwPanel(QDialog):
                     color = colors[idx % len(colors)]
                     idx += 1
                     sele_name = f"chain_highlight_{model}_{chain}"
-                    sele_str = " or ".join([f"/{r[0]}//{r[1]}/{r[2]}" for r in residues])
+                    sele_str = self._grouped_selection(residues)
                     cmd.select(sele_name, sele_str)
+                    self._highlight_names.add(sele_name)
                     cmd.color(color, sele_name)
                     first_res_tuple = sorted(residues, key=self._residue_sort_key)[0]
-                    label_sele = f"/{first_res_tuple[0]}//{first_res_tuple[1]}/{first_res_tuple[2]} and name CA"
+                    label_sele = f"{self._residue_sele(first_res_tuple)} and name CA"
                     cmd.label(label_sele, f'"Chain {chain}"')
             else:
-                sele_str = " or ".join([f"/{r[0]}//{r[1]}/{r[2]}" for r in self.residues_to_mutate])
+                sele_str = self._grouped_selection(self.residues_to_mutate)
                 cmd.select("highlight_sele", sele_str)
+                self._highlight_names.add("highlight_sele")
                 cmd.color("yellow", "highlight_sele")
 
+        self._ensure_resn_cache()
         for res_tuple in self.residues_to_mutate:
             if res_tuple not in self.original_residues:
-                model, chain, resi = res_tuple
-                my_space = {'resn_list': []}
-                try:
-                    cmd.iterate(f"/{model}//{chain}/{resi} and name CA", 'resn_list.append(resn)', space=my_space)
-                    if my_space['resn_list']:
-                        self.original_residues[res_tuple] = my_space['resn_list'][0]
-                except Exception:
-                    self.original_residues[res_tuple] = "UNK"
+                self.original_residues[res_tuple] = self._resn_cache.get(res_tuple, "UNK")
 
         self.sorted_residue_list = sorted(list(self.residues_to_mutate), key=self._residue_sort_key)
 
         try:
-            self.individual_table.blockSignals(True)
-            self.individual_table.setRowCount(len(self.sorted_residue_list))
-            for row, res_tuple in enumerate(self.sorted_residue_list):
-                resn = self.original_residues.get(res_tuple, "UNK")
-                item_text = f"{res_tuple[0]}/{res_tuple[1]}/{resn}{res_tuple[2]}"
-                self.individual_table.setItem(row, 0, QTableWidgetItem(item_text))
-                combo_box = QComboBox(self.individual_table)
-                combo_box.addItems(self.amino_acids)
-                if res_tuple in self.csv_targets:
-                    combo_box.setCurrentText(self.csv_targets[res_tuple])
-                combo_box.currentTextChanged.connect(partial(self.handle_combobox_change, row))
-                self.individual_table.setCellWidget(row, 1, combo_box)
+            previous_targets = dict(zip(self.residue_model._rows, self.residue_model._targets))
+            targets = [
+                self.csv_targets.get(r, previous_targets.get(r, self.amino_acids[0]))
+                for r in self.sorted_residue_list
+            ]
+            self.residue_model.set_residues(self.sorted_residue_list, targets)
         except Exception as e:
             debug_log(f"_populate_table GUI error: {e}")
-        finally:
-            self.individual_table.blockSignals(False)
 
         self.refresh_panel_view()
 
+    def _on_model_data_changed(self, top_left, bottom_right, roles=None):
+        self.handle_combobox_change(top_left.row(), self.residue_model.target_for_row(top_left.row()))
+
     def handle_combobox_change(self, row, text):
         if self.step_mode_radio.isChecked() and row == self.step_index:
             self.prime_wizard_for_step()
 
     def prepare_mutagenesis_wizard(self, is_step=False):
         try:
-            if not cmd.get_wizard():
+            wizard = cmd.get_wizard()
+            if not wizard:
                 cmd.wizard("mutagenesis")
+                wizard = cmd.get_wizard()
             cmd.refresh_wizard()
-            return True
+            self._wizard_installed = wizard is not None
+            self._primed_wizard = wizard
+            if self._target_object is None:
+                objs = cmd.get_object_list('(all)')
+                self._target_object = objs[0] if objs else None
+            return wizard
         except CmdException as e:
             QMessageBox.critical(self, "Error", f"Could not launch PyMOL's mutagenesis wizard.\n{e}")
-            return False
+            return None
 
-    def preview_mutation(self, residue, new_aa):
-        model, chain, resi = residue
-        selection_string = f"/{model}//{chain}/{resi}"
+    def _apply_sculpt_settings(self):
+        caps = get_pymol_caps()
+        if not caps["supports_sculpting"]:
+            return
+        if "Sculpt" in self.refinement_combo.currentText():
+            desired = (True, self.sculpt_cycles_spinbox.value())
+        else:
+            desired = (False, None)
+        if desired == self._last_sculpt_state:
+            return
         try:
-            if not self.prepare_mutagenesis_wizard():
+            cmd.set("sculpting", 1 if desired[0] else 0)
+            if desired[0] and caps["sculpt_setting_name"]:
+                cmd.set(caps["sculpt_setting_name"], desired[1])
+            self._last_sculpt_state = desired
+        except Exception as e:
+            debug_log(f"Sculpt enabling error (continuing): {e}")
+
+    def preview_mutation(self, residue, new_aa, configure_sculpt=True, wizard=None):
+        selection_string = self._residue_sele(residue)
+        try:
+            if wizard is None:
+                wizard = self.prepare_mutagenesis_wizard()
+            if not wizard:
                 return False
-            wizard = cmd.get_wizard()
-            if "Sculpt" in self.refinement_combo.currentText() and PYMOL_CAPS["supports_sculpting"]:
-                try:
-                    cmd.set("sculpting", 1)
-                    cycles = self.sculpt_cycles_spinbox.value()
-                    sculpt_setting = PYMOL_CAPS["sculpt_setting_name"]
-                    if sculpt_setting:
-                        cmd.set(sculpt_setting, cycles)
-                except Exception as e:
-                    debug_log(f"Sculpt enabling error (continuing): {e}")
-            else:
-                if PYMOL_CAPS["supports_sculpting"]:
-                    try:
-                        cmd.set("sculpting", 0)
-                    except Exception:
-                        pass
+            if configure_sculpt:
+                self._apply_sculpt_settings()
             wizard.do_select(selection_string)
             wizard.set_mode(new_aa)
             cmd.refresh_wizard()
+            self._rotamer_total = None
             return True
         except Exception as e:
             if "unknown Setting" not in str(e):
                 debug_log(f"Error priming wizard for {selection_string}: {e}")
             return False
 
-    def execute_mutation(self, residue, new_amino_acid):
-        if not self.preview_mutation(residue, new_amino_acid):
+    def execute_mutation(self, residue, new_amino_acid, configure_sculpt=True, defer_visuals=False, wizard=None):
+        if wizard is None:
+            wizard = self.prepare_mutagenesis_wizard()
+            if not wizard:
+                return False
+        if not self.preview_mutation(residue, new_amino_acid, configure_sculpt=configure_sculpt, wizard=wizard):
             return False
         try:
-            wizard = cmd.get_wizard()
             wizard.apply()
-            self._record_mutation(residue, new_amino_acid)
+            if defer_visuals:
+                self._record_mutation_data_only(residue, new_amino_acid)
+            else:
+                self._record_mutation(residue, new_amino_acid)
             return True
         except Exception as e:
             debug_log(f"Failed to mutate {residue}. Error: {e}")
             return False
 
     def run_all_mutations(self):
-        if not self.prepare_mutagenesis_wizard():
+        wizard = self.prepare_mutagenesis_wizard()
+        if wizard is None:
             return None
         skipped = []
-        for row, residue in enumerate(list(self.sorted_residue_list)):
-            try:
-                new_aa = self.batch_aa_dropdown.currentText() if self.batch_mode_radio.isChecked() else self.individual_table.cellWidget(row, 1).currentText()
-                ok = self.execute_mutation(residue, new_aa)
-                if not ok:
+        self._apply_sculpt_settings()
+        try:
+            cmd.set("suspend_updates", 1)
+            cmd.feedback("disable", "all", "actions")
+        except Exception as e:
+            debug_log(f"Could not suspend updates: {e}")
+        applied = []
+        # Qt accessor dispatches hoisted out of the hot loop; neither the
+        # mode nor the batch target can change mid-run.
+        is_batch = self.batch_mode_radio.isChecked()
+        batch_aa = self.batch_aa_dropdown.currentText() if is_batch else None
+        target_for_row = self.residue_model.target_for_row
+        try:
+            for row, residue in enumerate(list(self.sorted_residue_list)):
+                try:
+                    new_aa = batch_aa if is_batch else target_for_row(row)
+                    ok = self.execute_mutation(residue, new_aa, configure_sculpt=False, defer_visuals=True, wizard=wizard)
+                    if ok:
+                        applied.append((residue, new_aa))
+                    else:
+                        skipped.append(residue)
+                except Exception as e:
+                    debug_log(f"Error during mutation loop: {e}")
                     skipped.append(residue)
+            self._apply_batch_visuals(applied)
+        finally:
+            try:
+                cmd.set("suspend_updates", 0)
+                cmd.feedback("enable", "all", "actions")
+                cmd.rebuild()
             except Exception as e:
-                debug_log(f"Error during mutation loop: {e}")
-                skipped.append(residue)
+                debug_log(f"Could not resume updates: {e}")
         self.finalize_and_cleanup(finish_run=True)
         return skipped
 
@@ -692,7 +1011,7 @@ class PyBmwPanel(QDialog):
         if not self.sorted_residue_list or self.step_index >= len(self.sorted_residue_list):
             return
         residue = self.sorted_residue_list[self.step_index]
-        new_aa = self.individual_table.cellWidget(self.step_index, 1).currentText()
+        new_aa = self.residue_model.target_for_row(self.step_index)
         if self.execute_mutation(residue, new_aa):
             if self.sorted_residue_list:
                 self.prime_wizard_for_step()
@@ -701,36 +1020,59 @@ class PyBmwPanel(QDialog):
         else:
             QMessageBox.warning(self, "Mutation Failed", f"Could not apply mutation for {residue} to {new_aa}.")
 
-    def _record_mutation(self, residue, new_aa):
-        model, chain, resi = residue
-        selection_string = f"/{model}//{chain}/{resi}"
-        try:
-            cmd.color("cyan", selection_string)
-            cmd.show("sticks", selection_string)
-        except Exception:
-            pass
-        original_resn = self.original_residues.get(residue, "UNK")
-        label_text = f'"{original_resn}{resi} -> {new_aa}"'
+    def _record_mutation_data_only(self, residue, new_aa):
+        if residue not in self.mutated_residue_info:
+            self._mut_groups[(residue[0], residue[1])].append(residue[2])
+        self.mutated_residue_info[residue] = new_aa
+        self.residues_to_mutate.discard(residue)
+        self._has_objects = True
+        self._mut_version += 1
+
+    def _apply_batch_visuals(self, mutated):
+        if not mutated:
+            return
+        self._visuals_applied = True
+        group_sele = self._grouped_selection([residue for residue, _ in mutated])
         try:
-            cmd.label(f"{selection_string} and name CA", label_text)
+            cmd.color("cyan", group_sele)
+            cmd.show("sticks", group_sele)
         except Exception:
             pass
-        self.mutated_residue_info[residue] = new_aa
+        for residue, new_aa in mutated:
+            original_resn = self.original_residues.get(residue, "UNK")
+            try:
+                cmd.label(f"{self._residue_sele(residue)} and name CA", f'"{original_resn}{residue[2]} -> {new_aa}"')
+            except Exception:
+                pass
+
+    def _record_mutation(self, residue, new_aa):
+        self._record_mutation_data_only(residue, new_aa)
+        self._apply_batch_visuals([(residue, new_aa)])
 
         is_step_mode = self.step_mode_radio.isChecked()
         current_residue_at_index = self.sorted_residue_list[self.step_index] if is_step_mode and self.step_index < len(self.sorted_residue_list) else None
 
-        if residue in self.residues_to_mutate:
-            self.residues_to_mutate.remove(residue)
-
-        self._populate_table()
+        try:
+            row_idx = self.sorted_residue_list.index(residue)
+        except ValueError:
+            row_idx = None
+        chain_emptied = (residue[0], residue[1]) not in {(r[0], r[1]) for r in self.residues_to_mutate}
 
-        if is_step_mode and current_residue_at_index:
-            try:
-                self.step_index = self.sorted_residue_list.index(current_residue_at_index)
-            except ValueError:
-                if self.step_index >= len(self.sorted_residue_list):
-                    self.step_index = max(0, len(self.sorted_residue_list) - 1)
+        if row_idx is None or chain_emptied:
+            # Chain-group count changed, so highlight colors need rebalancing.
+            self._populate_table()
+            if is_step_mode and current_residue_at_index:
+                try:
+                    self.step_index = self.sorted_residue_list.index(current_residue_at_index)
+                except ValueError:
+                    pass
+        else:
+            self.sorted_residue_list.pop(row_idx)
+            self.residue_model.remove_row(row_idx)
+            if is_step_mode and row_idx < self.step_index:
+                self.step_index -= 1
+        if self.step_index >= len(self.sorted_residue_list):
+            self.step_index = max(0, len(self.sorted_residue_list) - 1)
 
         self.info_label.setText(f"{len(self.mutated_residue_info)} total mutations applied.")
         self.refresh_panel_view()
@@ -747,7 +1089,7 @@ class PyBmwPanel(QDialog):
             self.refresh_panel_view()
             self.prime_wizard_for_step()
 
-    def prime_wizard_from_table_selection(self):
+    def prime_wizard_from_table_selection(self, *args):
         if not self.step_mode_radio.isChecked():
             return
         selected_rows = self.individual_table.selectionModel().selectedRows()
@@ -762,19 +1104,53 @@ class PyBmwPanel(QDialog):
             return
         if self.step_index >= len(self.sorted_residue_list):
             return
-        if not self.prepare_mutagenesis_wizard(is_step=True):
+        # Re-entering prepare_mutagenesis_wizard per step is idempotent but
+        # not free; reuse the primed handle and let do_select switch residue.
+        cached = self._wizard_installed and self._primed_wizard is not None
+        wizard = self._primed_wizard if cached else self.prepare_mutagenesis_wizard(is_step=True)
+        if not wizard:
             return
         residue = self.sorted_residue_list[self.step_index]
-        new_aa = self.individual_table.cellWidget(self.step_index, 1).currentText()
-        if self.preview_mutation(residue, new_aa):
+        new_aa = self.residue_model.target_for_row(self.step_index)
+        ok = self.preview_mutation(residue, new_aa, wizard=wizard)
+        if not ok and cached:
+            # The user may have dismissed the wizard from PyMOL's own menu,
+            # leaving a dead handle; relaunch once before giving up.
+            self._primed_wizard = None
+            self._wizard_installed = False
+            wizard = self.prepare_mutagenesis_wizard(is_step=True)
+            if wizard:
+                ok = self.preview_mutation(residue, new_aa, wizard=wizard)
+        if ok:
             self._update_rotamer_label()
         else:
             self.rotamer_info_label.setText("Rotamer: N/A")
 
+    # Pair-search radius covers the largest vdW sum plus slack; an atom
+    # pair clashes when it overlaps by more than 0.6 A, matching
+    # find_pairs(mode=1, cutoff=-0.6).
+    CLASH_QUERY_RADIUS = 4.0
+    CLASH_OVERLAP = -0.6
+
     def scan_for_steric_clashes(self):
         if not self.mutated_residue_info:
             return 0
-        mutated_sele = " or ".join([f"/{r[0]}//{r[1]}/{r[2]}" for r in self.mutated_residue_info.keys()])
+        if self._last_scan_version == self._mut_version:
+            return self._last_scan_count
+        count = None
+        if SCIPY_AVAILABLE and NUMPY_AVAILABLE:
+            try:
+                count = self._scan_clashes_kdtree()
+            except Exception as e:
+                debug_log(f"KDTree clash scan failed, using find_pairs: {e}")
+        if count is None:
+            count = self._scan_clashes_pymol()
+        self._last_scan_version = self._mut_version
+        self._last_scan_count = count
+        return count
+
+    def _scan_clashes_pymol(self):
+        mutated_sele = self._mutated_selection()
         surround_sele = f"byres ({mutated_sele}) around 5"
         try:
             clashes = cmd.find_pairs(mutated_sele, f"not ({mutated_sele}) and ({surround_sele})", mode=1, cutoff=-0.6)
@@ -782,52 +1158,163 @@ class PyBmwPanel(QDialog):
         except Exception:
             return 0
 
+    def _collect_clash_arrays(self):
+        """One pass over all loaded objects: SoA arrays of coordinates,
+        integer residue indices, a mutated-residue mask, vdW radii, and
+        per-residue chain ids / sequence numbers for neighbour exclusion."""
+        coords = []
+        res_index = []
+        vdw = []
+        res_map = {}
+        for obj in cmd.get_object_list('(all)'):
+            # Every atom, not just polymer: clashes against ligands, ions,
+            # and waters must be caught too, matching the find_pairs path.
+            model = cmd.get_model(obj)
+            for atom in model.atom:
+                res_id = (obj, atom.chain, atom.resi)
+                coords.append(atom.coord)
+                res_index.append(res_map.setdefault(res_id, len(res_map)))
+                vdw.append(_VDW_RADII.get((atom.symbol or '').upper(), _DEFAULT_VDW))
+        if not coords:
+            return None
+        res_index = np.asarray(res_index, dtype=np.int32)
+        # Vectorized mutated mask: K residue-id lookups + one np.isin pass
+        # instead of a Python set test per atom.
+        mut_res = [res_map[r] for r in self.mutated_residue_info if r in res_map]
+        mut = np.isin(res_index, np.asarray(mut_res, dtype=np.int32))
+        # Per-residue (not per-atom) chain ids and numeric sequence
+        # positions, so the counter can skip covalently bonded neighbours.
+        chain_map = {}
+        res_chain = np.empty(len(res_map), dtype=np.int32)
+        res_seq = np.empty(len(res_map), dtype=np.int32)
+        for (obj, chain, resi), idx in res_map.items():
+            res_chain[idx] = chain_map.setdefault((obj, chain), len(chain_map))
+            m = _RESI_NUMBER.search(resi)
+            res_seq[idx] = int(m.group()) if m else 0
+        return (np.asarray(coords, dtype=np.float32),
+                res_index,
+                mut,
+                np.asarray(vdw, dtype=np.float32),
+                res_chain,
+                res_seq)
+
+    def _get_clash_arrays(self):
+        """Coordinates only move when a mutation is committed, so the arrays
+        are cached against _mut_version instead of re-read per scan."""
+        if self._clash_arrays_version != self._mut_version:
+            self._clash_arrays = self._collect_clash_arrays()
+            self._clash_arrays_version = self._mut_version
+        return self._clash_arrays
+
+    def _scan_clashes_kdtree(self):
+        return self._count_clashes_from_arrays(self._get_clash_arrays())
+
+    def _count_clashes_from_arrays(self, arrays):
+        if arrays is None:
+            return 0
+        coords, res_idx, mut, vdw, res_chain, res_seq = arrays
+        if not mut.any():
+            return 0
+        tree = cKDTree(coords, balanced_tree=False, compact_nodes=False)
+        pairs = tree.query_pairs(r=self.CLASH_QUERY_RADIUS, output_type='ndarray')
+        if pairs.size == 0:
+            return 0
+        i, j = pairs[:, 0], pairs[:, 1]
+        ri, rj = res_idx[i], res_idx[j]
+        # Peptide-bonded neighbours (C(i-1)-N(i), O(i-1)...N(i)) sit far
+        # inside their vdW sums by construction, so same-chain residues one
+        # apart are skipped, like find_pairs(mode=1) skipping bonded pairs.
+        mask = ((mut[i] ^ mut[j]) & (ri != rj)
+                & ~((res_chain[ri] == res_chain[rj])
+                    & (np.abs(res_seq[ri] - res_seq[rj]) <= 1)))
+        if not mask.any():
+            return 0
+        i, j = i[mask], j[mask]
+        dist = np.linalg.norm(coords[i] - coords[j], axis=1)
+        return int(((dist - (vdw[i] + vdw[j])) < self.CLASH_OVERLAP).sum())
+
     def finalize_and_cleanup(self, finish_run=False):
-        try:
-            if cmd.get_wizard():
-                if not self.step_mode_radio.isChecked() or finish_run:
-                    try:
-                        cmd.set_wizard()
-                    except Exception:
-                        pass
-            if self.mutated_residue_info:
-                try:
-                    cmd.select("mutated_residues", " or ".join([f"/{r[0]}//{r[1]}/{r[2]}" for r in self.mutated_residue_info.keys()]))
-                except Exception:
-                    pass
+        if self._wizard_installed and (not self.step_mode_radio.isChecked() or finish_run):
             try:
-                cmd.delete("highlight_sele")
-                cmd.delete("chain_highlight_*")
-            except Exception:
-                pass
-            if not finish_run:
-                try:
-                    cmd.deselect()
-                except Exception:
-                    pass
-            try:
-                cmd.set("label_color", "white")
-                cmd.set("label_size", -0.8)
+                cmd.set_wizard()
+                self._wizard_installed = False
+                self._primed_wizard = None
             except Exception:
                 pass
-        except Exception:
-            pass
+        if self.mutated_residue_info:
+            _safe(cmd.select, "mutated_residues", self._mutated_selection())
+        # One dispatch into PyMOL's command queue instead of five.
+        cleanup = []
+        if self._highlight_names:
+            cleanup.append("delete " + " ".join(self._highlight_names))
+            self._highlight_names.clear()
+        if not finish_run:
+            cleanup.append("deselect")
+        cleanup.append("set label_color, white")
+        cleanup.append("set label_size, -0.8")
+        _safe(cmd.do, "; ".join(cleanup), echo=0)
 
     def handle_export(self):
+        if self._export_scan_pending:
+            return
         if not self.mutated_residue_info:
             reply = QMessageBox.question(self, "No Mutations Found", "No mutations have been applied yet.\n\nDo you still want to export the current state?", QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
             if reply == QMessageBox.No:
                 return
-        if self.scan_for_steric_clashes() > 0:
+        if self.mutated_residue_info and self._last_scan_version == self._mut_version:
+            self._finish_export_clash_check(self._last_scan_count)
+            return
+        if SCIPY_AVAILABLE and NUMPY_AVAILABLE and self.mutated_residue_info:
+            # Atom data comes from PyMOL here on the GUI thread; only the
+            # pure NumPy/SciPy counting runs on the worker.
+            try:
+                arrays = self._get_clash_arrays()
+            except Exception as e:
+                debug_log(f"Clash array collection failed: {e}")
+                arrays = None
+            self._export_scan_pending = True
+            self._pending_scan_version = self._mut_version
+            self.info_label.setText("Checking for steric clashes...")
+            worker = _ClashWorker(lambda: self._count_clashes_from_arrays(arrays))
+            worker.signals.finished.connect(self._finish_export_clash_check)
+            QThreadPool.globalInstance().start(worker)
+            return
+        self._finish_export_clash_check(self.scan_for_steric_clashes())
+
+    def _finish_export_clash_check(self, clash_count):
+        if self._export_scan_pending and self._pending_scan_version == self._mut_version:
+            self._last_scan_version = self._mut_version
+            self._last_scan_count = clash_count
+        self._export_scan_pending = False
+        self.info_label.setText(f"{len(self.mutated_residue_info)} total mutations applied." if self.mutated_residue_info else "Ready. Select residues and click 'Add to Selection'.")
+        if clash_count > 0:
             reply = QMessageBox.warning(self, "Clash Warning", "Severe steric clashes detected. It’s better to fix these before exporting.\n\nExport anyway?", QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
             if reply == QMessageBox.No:
                 return
-        all_objects = cmd.get_object_list('(all)')
-        if not all_objects:
+        self._do_export()
+
+    def _get_target_object(self):
+        if self._target_object:
+            try:
+                if self._target_object in cmd.get_names("objects"):
+                    return self._target_object
+            except Exception:
+                pass
+        try:
+            objs = cmd.get_object_list('(all)')
+        except Exception:
+            objs = []
+        self._target_object = objs[0] if objs else None
+        return self._target_object
+
+    def _do_export(self):
+        object_name = self._get_target_object()
+        if not object_name:
             QMessageBox.critical(self, "Error", "No objects loaded to export.")
             return
-        object_name = all_objects[0]
-        export_choice = ExportDialog.get_export_options(self)
+        if self._export_dialog is None:
+            self._export_dialog = ExportDialog(self)
+        export_choice = self._export_dialog.get_choice()
         if not export_choice:
             return
 
@@ -835,42 +1322,71 @@ class PyBmwPanel(QDialog):
             folder_path = QFileDialog.getExistingDirectory(self, "Select Directory to Save Files")
             if folder_path:
                 try:
-                    pdb_file_path = os.path.join(folder_path, f"{object_name}_mutated.pdb")
-                    session_path = os.path.join(folder_path, f"{object_name}_mutated.pse")
-                    pdb_saved = self._save_pdb(object_name, file_path=pdb_file_path)
-                    session_saved = self._save_session(file_path=session_path)
+                    base = Path(folder_path)
+                    # Synchronous write: the combined success message below
+                    # must reflect whether the PDB actually hit disk.
+                    pdb_saved = self._save_pdb(object_name, file_path=str(base / f"{object_name}_mutated.pdb"), notify=False, sync=True)
+                    session_saved = self._save_session(file_path=str(base / f"{object_name}_mutated.pse"))
                     if pdb_saved or session_saved:
                         QMessageBox.information(self, "Success", f"Files saved in:\n{folder_path}")
                 except Exception as e:
                     QMessageBox.critical(self, "Error", f"Could not save files. Error: {e}")
         elif export_choice == "pdb":
-            pdb_path = self._save_pdb(object_name)
-            if pdb_path:
-                QMessageBox.information(self, "Success", f"File saved:\n{pdb_path}")
+            # Success/failure is reported from the write worker's signal.
+            self._save_pdb(object_name)
         elif export_choice == "session":
             session_path = self._save_session()
             if session_path:
                 QMessageBox.information(self, "Success", f"File saved:\n{session_path}")
 
-    def _save_pdb(self, object_name, file_path=None):
-        fileName = file_path or QFileDialog.getSaveFileName(self, "Save Mutated PDB", f"{object_name}_mutated.pdb", "PDB Files (*.pdb);;All Files (*)")[0]
-        if fileName:
+    # kind -> (dialog title, name filter, error title)
+    _SAVE_KINDS = {
+        "pdb": ("Save Mutated PDB", "PDB Files (*.pdb);;All Files (*)", "PDB Save Error"),
+        "session": ("Save PyMOL Session", "PyMOL Session Files (*.pse);;All Files (*)", "Session Save Error"),
+    }
+
+    def _save(self, kind, object_name=None, file_path=None, notify=True, sync=False):
+        title, name_filter, error_title = self._SAVE_KINDS[kind]
+        default_name = f"{object_name}_mutated.pdb" if kind == "pdb" else "mutated_session.pse"
+        fileName = file_path or QFileDialog.getSaveFileName(self, title, default_name, name_filter)[0]
+        if not fileName:
+            return None
+        if kind == "pdb":
             try:
-                cmd.save(fileName, object_name)
-                return fileName
+                # Serialize on the GUI thread (PyMOL API), write on a worker.
+                data = cmd.get_pdbstr(object_name)
             except Exception as e:
-                QMessageBox.critical(self, "PDB Save Error", f"Could not save PDB file. Error: {e}")
-        return None
+                QMessageBox.critical(self, error_title, f"Could not save PDB file. Error: {e}")
+                return None
+            if sync:
+                try:
+                    Path(fileName).write_bytes(data.encode())
+                    return fileName
+                except Exception as e:
+                    QMessageBox.critical(self, error_title, f"Could not save PDB file. Error: {e}")
+                    return None
+            worker = _FileWriteWorker(fileName, data.encode())
+            worker.signals.finished.connect(lambda ok, path: self._on_pdb_write_finished(ok, path, notify))
+            QThreadPool.globalInstance().start(worker)
+            return fileName
+        try:
+            cmd.save(fileName)
+            return fileName
+        except Exception as e:
+            QMessageBox.critical(self, error_title, f"Could not save session file. Error: {e}")
+            return None
+
+    def _save_pdb(self, object_name, file_path=None, notify=True, sync=False):
+        return self._save("pdb", object_name=object_name, file_path=file_path, notify=notify, sync=sync)
 
     def _save_session(self, file_path=None):
-        fileName = file_path or QFileDialog.getSaveFileName(self, "Save PyMOL Session", "mutated_session.pse", "PyMOL Session Files (*.pse);;All Files (*)")[0]
-        if fileName:
-            try:
-                cmd.save(fileName)
-                return fileName
-            except Exception as e:
-                QMessageBox.critical(self, "Session Save Error", f"Could not save session file. Error: {e}")
-        return None
+        return self._save("session", file_path=file_path)
+
+    def _on_pdb_write_finished(self, ok, path, notify):
+        if not ok:
+            QMessageBox.critical(self, "PDB Save Error", f"Could not write PDB file:\n{path}")
+        elif notify:
+            QMessageBox.information(self, "Success", f"File saved:\n{path}")
 
     def _get_email(self):
         email = self.saves_email_input.text().strip()
@@ -980,34 +1496,41 @@ class PyBmwPanel(QDialog):
 
     def reject(self):
         try:
-            if cmd.get_wizard():
+            if self._wizard_installed:
                 cmd.set_wizard()
+                self._wizard_installed = False
+                self._primed_wizard = None
         except Exception as e:
             debug_log(f"Error closing wizard on exit: {e}")
         self.finalize_and_cleanup()
         super(PyBmwPanel, self).reject()
 
 def launch_pybmw_plugin():
-    global dialog
+    global dialog, _cached_parent
     if not PYQT_AVAILABLE:
         _safe_print("PyBmw launch failed: PyQt5 dependencies not met.")
         return
 
-    parent = None
-    try:
-        from pymol.Qt import get_parent_window
-        parent = get_parent_window()
-    except Exception:
+    get_pymol_caps()
+
+    parent = _cached_parent() if _cached_parent is not None else None
+    if parent is None:
         try:
-            for widget in QApplication.topLevelWidgets():
-                try:
-                    if widget.isWindow() and "PyMOL" in widget.windowTitle():
-                        parent = widget
-                        break
-                except Exception:
-                    continue
+            from pymol.Qt import get_parent_window
+            parent = get_parent_window()
         except Exception:
-            parent = None
+            try:
+                for widget in QApplication.topLevelWidgets():
+                    try:
+                        if widget.isWindow() and "PyMOL" in widget.windowTitle():
+                            parent = widget
+                            break
+                    except Exception:
+                        continue
+            except Exception:
+                parent = None
+        if parent is not None:
+            _cached_parent = weakref.ref(parent)
 
     if dialog is None:
         dialog = PyBmwPanel(parent)
@@ -1027,10 +1550,8 @@ def launch_pybmw_plugin():
 def __init_plugin__(self=None):
     if not PYQT_AVAILABLE:
         return
-    try:
-        detect_pymol_capabilities()
-    except Exception as e:
-        debug_log(f"Re-detect failed: {e}")
+    # Capability probing is deferred to the first launch (get_pymol_caps
+    # memoizes it); registering the menu item is all startup needs.
     addmenuitemqt('Python Batch Mutation Wizard (PyBmw)', launch_pybmw_plugin)
 
 if __name__ == "__main__":